@@ -31,6 +31,29 @@ from typing import Any, Protocol
 
 from sliplib.slipwrapper import SlipWrapper
 
+_DEFAULT_CHUNK_SIZE = io.DEFAULT_BUFFER_SIZE
+
+# Stream attributes that are not exposed by SlipStream, because using them
+# would invalidate the internal state maintained by SlipStream.
+_UNSUPPORTED_ATTRIBUTE_PREFIXES = ("read", "write")
+_UNSUPPORTED_ATTRIBUTES = frozenset(
+    {
+        "detach",
+        "flushInput",
+        "flushOutput",
+        "getbuffer",
+        "getvalue",
+        "peek",
+        "raw",
+        "reset_input_buffer",
+        "reset_output_buffer",
+        "seek",
+        "seekable",
+        "tell",
+        "truncate",
+    }
+)
+
 
 class IOStream(Protocol):
     """
@@ -52,7 +75,7 @@ class IOStream(Protocol):
             The number of bytes read may be less than the number specified by `chunksize`.
         """
 
-    def write(self, data: bytes) -> int:
+    def write(self, data: bytes) -> int | None:
         """Write data to the stream.
 
         Args:
@@ -61,6 +84,8 @@ class IOStream(Protocol):
         Returns:
             The number of bytes actually written. This may be less than the
             number of bytes contained in `data`.
+            :external:obj:`None` indicates that no bytes could be written
+            (e.g. for a non-blocking stream), in which case the write is retried.
         """
 
 
@@ -98,7 +123,7 @@ class SlipStream(SlipWrapper[IOStream]):
 
     """
 
-    def __init__(self, stream: IOStream, chunk_size: int = io.DEFAULT_BUFFER_SIZE):
+    def __init__(self, stream: IOStream, chunk_size: int = _DEFAULT_CHUNK_SIZE):
         """
         To instantiate a :class:`SlipStream` object, the user must provide
         a pre-constructed open byte stream that is ready for reading and/or writing.
@@ -137,19 +162,36 @@ class SlipStream(SlipWrapper[IOStream]):
             raise TypeError(error_msg)
 
         #: The number of bytes to read during each read operation.
-        self.chunk_size = chunk_size if chunk_size > 0 else io.DEFAULT_BUFFER_SIZE
+        self.chunk_size = chunk_size if chunk_size > 0 else _DEFAULT_CHUNK_SIZE
+
+        # Set when the end of the stream has been reached; the stream is not read after that.
+        self._eof = False
 
         super().__init__(stream)
 
     def send_bytes(self, packet: bytes) -> None:
         """See base class."""
-        while packet:
-            number_of_bytes_written = self.stream.write(packet)
-            packet = packet[number_of_bytes_written:]
+        size = len(packet)
+        if not size:
+            return
+        write = self.stream.write
+        # Most streams write the complete packet at once.
+        offset = write(packet) or 0
+        if offset == size:
+            return
+        # The remainder of the packet is only copied after a partial write, which is rare.
+        while offset < size:
+            offset += write(packet[offset:]) or 0
 
     def recv_bytes(self) -> bytes:
         """See base class."""
-        return b"" if self._stream_is_closed else self.stream.read(self.chunk_size)
+        if self._eof:
+            return b""
+        stream = self.stream
+        data = b"" if getattr(stream, "closed", False) else stream.read(self.chunk_size)
+        if not data:
+            self._eof = True
+        return data
 
     @property
     def readable(self) -> bool:
@@ -169,30 +211,8 @@ class SlipStream(SlipWrapper[IOStream]):
         """
         return getattr(self.stream, "writable", True)
 
-    @property
-    def _stream_is_closed(self) -> bool:
-        """Indicates if the wrapped stream is closed.
-
-        The value is :external:obj:`False` if it cannot be determined if the wrapped stream is closed.
-        """
-        return getattr(self.stream, "closed", False)
-
     def __getattr__(self, attribute: str) -> Any:
-        if attribute.startswith(("read", "write")) or attribute in (
-            "detach",
-            "flushInput",
-            "flushOutput",
-            "getbuffer",
-            "getvalue",
-            "peek",
-            "raw",
-            "reset_input_buffer",
-            "reset_output_buffer",
-            "seek",
-            "seekable",
-            "tell",
-            "truncate",
-        ):
+        if attribute.startswith(_UNSUPPORTED_ATTRIBUTE_PREFIXES) or attribute in _UNSUPPORTED_ATTRIBUTES:
             error_msg = f"'{self.__class__.__name__}' object has no attribute '{attribute}'"
             raise AttributeError(error_msg)
 
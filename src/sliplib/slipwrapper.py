@@ -20,6 +20,7 @@ The :class:`SlipWrapper` class can also be imported directly from the :mod:`slip
    Class :class:`SlipWrapper` offers the following methods and attributes:
 
    .. automethod:: recv_msg
+   .. automethod:: recv_all_pending
    .. automethod:: send_msg
    .. autoattribute:: driver
    .. autoattribute:: stream
@@ -34,12 +35,13 @@ The :class:`SlipWrapper` class can also be imported directly from the :mod:`slip
 from __future__ import annotations
 
 import abc
+from collections import deque
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-from sliplib.slip import Driver
+from sliplib.slip import Driver, ProtocolError
 
 ByteStream = TypeVar("ByteStream")  #: :class:`ByteStream` represents a generic byte stream.
 
@@ -75,7 +77,16 @@ class SlipWrapper(abc.ABC, Generic[ByteStream]):
         #: The wrapped :class:`ByteStream`.
         self.stream = stream
         #: The :class:`SlipWrapper`'s :class:`~sliplib.slip.Driver` instance.
+        #:
+        #: .. note::
+        #:    When :meth:`recv_msg` or :meth:`recv_all_pending` reads from the stream,
+        #:    all messages that the driver has already decoded are taken from the driver
+        #:    and kept in an internal queue of the :class:`SlipWrapper`.
+        #:    A direct call to :meth:`driver.get() <sliplib.slip.Driver.get>` does not return those messages.
         self.driver = Driver()
+        # Messages (or protocol errors) that have been retrieved from the driver,
+        # but not yet handed to the application.
+        self._pending: deque[bytes | ProtocolError] = deque()
 
     @abc.abstractmethod
     def send_bytes(self, packet: bytes) -> None:
@@ -125,11 +136,56 @@ class SlipWrapper(abc.ABC, Generic[ByteStream]):
                 A subsequent call to :meth:`recv_msg` (after handling the exception)
                 will return the message from the next packet.
         """
-        while (message := self.driver.get(block=False)) is None:
-            data = self.recv_bytes()
-            self.driver.receive(data)
+        if not self._pending:
+            self._receive_pending()
+        message = self._pending.popleft()
+        if isinstance(message, ProtocolError):
+            raise message
         return message
 
+    def recv_all_pending(self) -> list[bytes]:
+        """Receive all messages that are available.
+
+        If no message is available yet, data is read from the stream until
+        at least one message has been received.
+        All messages that can be decoded from the data received so far are then returned at once.
+
+        Returns:
+            A non-empty list of SLIP-decoded messages.
+            If the end of the byte stream has been reached,
+            the last element in the list is an empty bytes object :obj:`b""`.
+            This end-of-stream marker is not a message;
+            callers must check for it before processing the list as messages.
+
+        Raises:
+            ProtocolError: when a SLIP protocol error has been encountered
+                before any message could be returned.
+                If the protocol error occurs after one or more valid messages,
+                those messages are returned, and the error is raised by the next call
+                to :meth:`recv_all_pending` or :meth:`recv_msg`.
+        """
+        messages = [self.recv_msg()]
+        pending = self._pending
+        while pending and isinstance(message := pending[0], bytes):
+            messages.append(message)
+            pending.popleft()
+        return messages
+
+    def _receive_pending(self) -> None:
+        """Read from the stream until the driver has a message, and collect all available messages."""
+        driver = self.driver
+        while (message := driver.get(block=False)) is None:
+            driver.receive(self.recv_bytes())
+        pending = self._pending
+        pending.append(message)
+        # Collect any further messages that are already available, up to the end of the stream.
+        try:
+            while message and (message := driver.get(block=False)) is not None:
+                pending.append(message)
+        except ProtocolError as error:
+            # Defer the error until the messages before it have been handed out.
+            pending.append(error)
+
     def __iter__(self) -> Iterator[bytes]:
         while True:
             if not (msg := self.recv_msg()):
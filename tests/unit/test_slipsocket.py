@@ -346,3 +346,9 @@ class TestSlipSocket:
         expected = (b"hallo", b"bye")
         actual = tuple(msg for msg in self.slipsocket)
         assert expected == actual
+
+    def test_slip_socket_recv_all_pending(self) -> None:
+        """Test that a SlipSocket receives all messages from a single recv call at once."""
+        self.sock_mock.recv.side_effect = (END + b"hallo" + END + END + b"bye" + END, b"")
+        assert self.slipsocket.recv_all_pending() == [b"hallo", b"bye"]
+        assert self.slipsocket.recv_all_pending() == [b""]
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import io
 import warnings
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator
 
 import pytest
 
@@ -30,6 +30,71 @@ def test_slip_stream_fails_if_instantiated_with_non_bytestream_argument() -> Non
         SlipStream(io.StringIO())  # type: ignore[arg-type]
 
 
+class ByteStream:
+    """Minimal byte stream for testing the stream checks."""
+
+    def read(self, _chunksize: int) -> bytes:
+        return b""
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+class DelegatingStream:
+    """Stream wrapper that provides the attributes of the wrapped stream dynamically."""
+
+    def __init__(self, stream: object) -> None:
+        self.stream = stream
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.stream, attribute)
+
+
+def test_slip_stream_fails_if_stream_instance_has_encoding() -> None:
+    """SlipStream rejects a stream with encoding, even if its class has no encoding."""
+    stream = ByteStream()
+    stream.encoding = "utf-8"  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        SlipStream(stream)
+
+
+def test_slip_stream_fails_if_stream_instance_has_non_callable_method() -> None:
+    """SlipStream rejects a stream whose write attribute is not callable, even if its class has a write method."""
+    stream = ByteStream()
+    stream.write = None  # type: ignore[assignment]
+    with pytest.raises(TypeError):
+        SlipStream(stream)
+
+
+def test_slip_stream_checks_dynamically_provided_attributes() -> None:
+    """SlipStream checks the attributes of streams that provide them dynamically."""
+    stream = DelegatingStream(ByteStream())
+    assert SlipStream(stream).stream is stream
+    with pytest.raises(TypeError):
+        SlipStream(DelegatingStream(io.StringIO()))
+    with pytest.raises(TypeError):
+        SlipStream(DelegatingStream(object()))
+
+
+def test_slip_stream_reads_raw_stream_that_only_implements_read() -> None:
+    """SlipStream uses the read method of a stream, even if the stream inherits other read methods."""
+
+    class ReadOnlyRawStream(io.RawIOBase):
+        def __init__(self, data: bytes) -> None:
+            self.data = data
+
+        def read(self, size: int = -1) -> bytes:
+            data, self.data = self.data[:size], self.data[size:]
+            return data
+
+        def write(self, data: bytes) -> int:  # type: ignore[override]
+            return len(data)
+
+    slipstream = SlipStream(ReadOnlyRawStream(b"hallo" + END))
+    assert slipstream.recv_msg() == b"hallo"
+    assert slipstream.recv_msg() == b""
+
+
 class TestSlipStreamBasics:
     """Tests for basic SlipStream functionality."""
 
@@ -79,6 +144,14 @@ class TestSlipStreamBasics:
         assert self.slipstream.recv_msg() == b""
         assert self.stream_mock.read.mock_calls == [mocker.call(1)] * 13
 
+    def test_slipstream_does_not_read_after_end_of_stream(self, mocker: MockerFixture) -> None:
+        """Verify that the stream is no longer read once the end of the stream has been reached."""
+        self.stream_mock.read.side_effect = (b"hallo" + END, b"")
+        assert self.slipstream.recv_bytes() == b"hallo" + END
+        assert self.slipstream.recv_bytes() == b""
+        assert self.slipstream.recv_bytes() == b""
+        assert self.stream_mock.read.mock_calls == [mocker.call(io.DEFAULT_BUFFER_SIZE)] * 2
+
     def test_slipstream_writing(
         self,
         mocker: MockerFixture,
@@ -106,6 +179,26 @@ class TestSlipStreamBasics:
         call_list = [mocker.call(enc_msg[i:]) for enc_msg in encoded_messages for i in range(len(enc_msg))]
         assert self.stream_mock.write.mock_calls == call_list
 
+    def test_slipstream_writing_retries_when_nothing_is_written(self, mocker: MockerFixture) -> None:
+        """Verify that sending messages works when the stream's write method returns None (nothing written)."""
+        msg = b"hallo world"
+        packet = self.prefix + msg + END
+        self.stream_mock.write.side_effect = [None, 2, None, 3, None, len(packet) - 5]
+        self.slipstream.send_msg(msg)
+        assert self.stream_mock.write.mock_calls == [
+            mocker.call(packet),
+            mocker.call(packet),
+            mocker.call(packet[2:]),
+            mocker.call(packet[2:]),
+            mocker.call(packet[5:]),
+            mocker.call(packet[5:]),
+        ]
+
+    def test_slipstream_does_not_write_empty_packet(self) -> None:
+        """Verify that sending an empty packet does not call the stream's write method."""
+        self.slipstream.send_bytes(b"")
+        self.stream_mock.write.assert_not_called()
+
     def test_iterating_over_slipstream(self) -> None:
         """Verify that a SlipStream object can be iterated over."""
         msg_list = [b"hallo", b"bye"]
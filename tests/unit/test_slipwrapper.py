@@ -5,9 +5,21 @@
 
 """Tests for SlipWrapper."""
 
+from __future__ import annotations
+
 import pytest
 
-from sliplib import SlipWrapper
+from sliplib import END, ESC, ProtocolError, SlipWrapper
+
+
+class ChunkWrapper(SlipWrapper[list]):  # type: ignore[type-arg]
+    """Concrete SlipWrapper that receives data from a list of chunks."""
+
+    def send_bytes(self, packet: bytes) -> None:
+        self.stream.append(packet)
+
+    def recv_bytes(self) -> bytes:
+        return self.stream.pop(0) if self.stream else b""
 
 
 class TestSlipWrapper:
@@ -20,3 +32,54 @@ class TestSlipWrapper:
     def test_slip_wrapper_cannot_be_subclassed_without_concrete_implementations(self) -> None:
         with pytest.raises(TypeError):
             type("SubSlipWrapper", (SlipWrapper,), {})(None)  # Dummy subclass without implementation
+
+
+class TestSlipWrapperPendingMessages:
+    """Tests for receiving all pending messages with SlipWrapper."""
+
+    msg_list = (b"hallo", b"bye")
+
+    def test_recv_all_pending_returns_all_messages_from_a_single_read(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + self.msg_list[1] + END])
+        assert wrapper.recv_all_pending() == list(self.msg_list)
+        assert wrapper.recv_all_pending() == [b""]
+
+    def test_recv_all_pending_includes_end_of_stream(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + self.msg_list[1] + END, b""])
+        assert wrapper.recv_msg() == self.msg_list[0]
+        assert wrapper.recv_all_pending() == list(self.msg_list[1:])
+        assert wrapper.recv_all_pending() == [b""]
+
+    def test_recv_all_pending_reads_until_a_message_is_available(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0][:2], self.msg_list[0][2:] + END, self.msg_list[1] + END])
+        assert wrapper.recv_all_pending() == list(self.msg_list[:1])
+        assert wrapper.stream == [self.msg_list[1] + END]
+
+    def test_recv_msg_returns_messages_taken_from_the_driver(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + self.msg_list[1] + END])
+        assert wrapper.recv_msg() == self.msg_list[0]
+        # The second message has been taken from the driver, but is still received.
+        assert wrapper.driver.get(block=False) is None
+        assert wrapper.recv_msg() == self.msg_list[1]
+
+    def test_recv_all_pending_defers_protocol_error(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + ESC + END + self.msg_list[1] + END])
+        assert wrapper.recv_all_pending() == list(self.msg_list[:1])
+        with pytest.raises(ProtocolError):
+            wrapper.recv_all_pending()
+        assert wrapper.recv_all_pending() == list(self.msg_list[1:])
+        assert wrapper.recv_all_pending() == [b""]
+
+    def test_recv_msg_raises_deferred_protocol_error(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + ESC + END + self.msg_list[1] + END])
+        assert wrapper.recv_msg() == self.msg_list[0]
+        with pytest.raises(ProtocolError):
+            wrapper.recv_msg()
+        assert wrapper.recv_msg() == self.msg_list[1]
+
+    def test_iteration_after_break_keeps_pending_messages(self) -> None:
+        wrapper = ChunkWrapper([self.msg_list[0] + END + self.msg_list[1] + END])
+        for msg in wrapper:
+            assert msg == self.msg_list[0]
+            break
+        assert list(wrapper) == list(self.msg_list[1:])